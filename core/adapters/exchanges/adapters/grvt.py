@@ -95,7 +95,7 @@ class GrvtAdapter(ExchangeAdapter):
         price = max(float(price), 1.0)
         px = Decimal(str(price))
         if self.logger:
-            self.logger.debug(f"[GRVT MOCK] get_ticker {symbol} -> {px}")
+            self.logger.debug("[GRVT MOCK] get_ticker %s -> %s", symbol, px)
         now = datetime.utcnow()
         ticker = TickerData(
             symbol=symbol,
@@ -119,7 +119,7 @@ class GrvtAdapter(ExchangeAdapter):
 
     async def get_tickers(self, symbols: Optional[List[str]] = None) -> List[TickerData]:
         symbols = symbols or []
-        return [await self.get_ticker(symbol) for symbol in symbols]
+        return list(await asyncio.gather(*(self.get_ticker(symbol) for symbol in symbols)))
 
     async def get_orderbook(self, symbol: str, limit: Optional[int] = None) -> OrderBookData:
         now = datetime.utcnow()
@@ -144,10 +144,7 @@ class GrvtAdapter(ExchangeAdapter):
             symbols = [getattr(self.config, "symbol")]
         if not symbols:
             return []
-        positions: List[PositionData] = []
-        for sym in symbols:
-            positions.append(await self.rest.get_position(sym))
-        return positions
+        return list(await asyncio.gather(*(self.rest.get_position(sym) for sym in symbols)))
 
     async def order(
         self,
@@ -189,8 +186,12 @@ class GrvtAdapter(ExchangeAdapter):
         """
         if self.logger:
             self.logger.debug(
-                f"[GRVT MOCK] create_order symbol={symbol}, side={side}, "
-                f"price={price}, qty={quantity}, batch_mode={batch_mode}"
+                "[GRVT MOCK] create_order symbol=%s, side=%s, price=%s, qty=%s, batch_mode=%s",
+                symbol,
+                side,
+                price,
+                quantity,
+                batch_mode,
             )
 
         order_type_value = order_type.value if isinstance(order_type, OrderType) else str(order_type).lower()
@@ -220,21 +221,12 @@ class GrvtAdapter(ExchangeAdapter):
         raise ValueError(f"GRVT 未找到订单: {order_id}")
 
     async def cancel_all_orders(self, symbol: Optional[str] = None) -> List[OrderData]:
-        open_orders = await self.rest.get_open_orders(symbol)
-        cancelled: List[OrderData] = []
-        for order in open_orders:
-            updated = await self.rest.cancel_order(order.symbol, order.id)
-            if updated:
-                await self._emit_user_event(updated)
-                cancelled.append(updated)
+        cancelled = await self.rest.cancel_open_orders(symbol)
+        await self._emit_user_events(cancelled)
         return cancelled
 
     async def get_order(self, order_id: str, symbol: str) -> OrderData:
-        open_orders = await self.rest.get_open_orders(symbol)
-        for order in open_orders:
-            if order.id == order_id:
-                return order
-        # 如果未在开放订单中，尝试从缓存读取（包含已取消订单）
+        # 订单缓存按 id 索引（包含已取消订单），直接查表
         cached = self.rest._orders.get(order_id)  # type: ignore[attr-defined]
         if cached:
             return self.rest._to_order_data(cached)  # type: ignore[attr-defined]
@@ -247,12 +239,7 @@ class GrvtAdapter(ExchangeAdapter):
         self, symbol: Optional[str] = None, since: Optional[datetime] = None, limit: Optional[int] = None
     ) -> List[OrderData]:
         # 内存实现：返回所有已知订单
-        orders: List[OrderData] = []
-        for item in self.rest._orders.values():  # type: ignore[attr-defined]
-            if symbol and item.get("symbol") != symbol:
-                continue
-            orders.append(self.rest._to_order_data(item))  # type: ignore[attr-defined]
-        return orders
+        return await self.rest.get_orders(symbol)
 
     async def set_leverage(self, symbol: str, leverage: int) -> Dict[str, Any]:
         return {"symbol": symbol, "leverage": leverage, "status": "ok"}
@@ -288,11 +275,18 @@ class GrvtAdapter(ExchangeAdapter):
     async def unsubscribe(self, symbol: Optional[str] = None) -> None:
         # 轻量实现：清空回调
         self._order_callbacks.clear()
-        self.websocket._callbacks.clear()
+        await self.websocket.unsubscribe_user_stream()
 
     # === 内部工具 ===
 
     async def _emit_user_event(self, order: OrderData) -> None:
         """将订单事件推送到用户数据流。"""
 
-        await self.websocket.send_user_event(order)
+        if self.websocket.has_listeners:
+            await self.websocket.send_user_event(order)
+
+    async def _emit_user_events(self, orders: List[OrderData]) -> None:
+        """将一批订单事件一次性推送到用户数据流。"""
+
+        if orders and self.websocket.has_listeners:
+            await self.websocket.send_user_events(orders)
@@ -11,7 +11,8 @@
 
 from __future__ import annotations
 
-import asyncio
+import itertools
+import os
 import time
 from datetime import datetime
 from decimal import Decimal
@@ -31,6 +32,52 @@ from ..models import (
 )
 
 
+class _OrderRec:
+    """内存订单记录（__slots__ 结构体，替代逐字段哈希查找的字典）。"""
+
+    __slots__ = (
+        "id",
+        "client_id",
+        "symbol",
+        "side",
+        "type",
+        "price",
+        "amount",
+        "filled",
+        "status",
+        "timestamp",
+        "updated",
+        "cached_fields",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        client_id: Optional[str],
+        symbol: str,
+        side: OrderSide,
+        type: OrderType,
+        price: Decimal,
+        amount: Decimal,
+        filled: Decimal,
+        status: OrderStatus,
+        timestamp: datetime,
+        updated: Optional[datetime],
+    ):
+        self.id = id
+        self.client_id = client_id
+        self.symbol = symbol
+        self.side = side
+        self.type = type
+        self.price = price
+        self.amount = amount
+        self.filled = filled
+        self.status = status
+        self.timestamp = timestamp
+        self.updated = updated
+        self.cached_fields: Optional[Dict[str, Any]] = None
+
+
 class GrvtRest:
     """GRVT REST 客户端（轻量级模拟实现）"""
 
@@ -41,23 +88,41 @@ class GrvtRest:
         self.base_url = getattr(config, "base_url", None) or self.DEFAULT_BASE_URL
         self.api_key = getattr(config, "api_key", "")
         self.eth_private_key = getattr(config, "api_secret", "")
-        self.signer_address = getattr(getattr(config, "extra_params", {}), "get", lambda *_: None)(
-            "signer_address"
-        ) or getattr(config, "extra_params", {}).get("signer_address", "")
-        self.trading_account_id = getattr(config, "extra_params", {}).get("trading_account_id", "")
+        extra = getattr(config, "extra_params", None) or {}
+        self.signer_address = extra.get("signer_address", "")
+        self.trading_account_id = extra.get("trading_account_id", "")
 
         self.session: Optional[aiohttp.ClientSession] = None
-        self._orders: Dict[str, Dict[str, Any]] = {}
+        # 订单状态只在单个事件循环内同步修改（读写之间没有 await），无需加锁
+        self._orders: Dict[str, _OrderRec] = {}
+        # 按交易对的二级索引：全部订单与未完成订单，均保持创建顺序（dict 作有序集合）
+        self._orders_by_symbol: Dict[str, List[str]] = {}
+        self._open_by_symbol: Dict[str, Dict[str, None]] = {}
+        self._open_ids: Dict[str, None] = {}
+        # 客户端订单 ID：实例启动毫秒时间 + 进程号前缀 + 自增序号，
+        # 同一毫秒内下单、重启或多实例并存时都不会冲突
+        self._order_id_prefix = f"grvt_{int(time.time() * 1000)}_{os.getpid()}"
+        self._order_seq = itertools.count(1)
         self._balance: Decimal = Decimal("100000")  # 模拟USDC余额
         self._position_size: Dict[str, Decimal] = {}
-        self._lock = asyncio.Lock()
 
     async def connect(self) -> bool:
         """初始化 HTTP 会话。"""
         if self.session and not self.session.closed:
             return True
 
-        self.session = aiohttp.ClientSession()
+        # 长连接复用 + 较短超时，避免下单路径上频繁建连
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=8,
+            keepalive_timeout=300,
+            enable_cleanup_closed=True,
+            ttl_dns_cache=300,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=5, connect=1),
+        )
         if self.logger:
             self.logger.info("GRVT REST 已初始化 HTTP 会话")
         return True
@@ -68,6 +133,11 @@ class GrvtRest:
             await self.session.close()
         self.session = None
 
+    def new_order_id(self) -> str:
+        """生成客户端订单 ID。"""
+
+        return f"{self._order_id_prefix}_{next(self._order_seq)}"
+
     async def place_limit_order(
         self,
         symbol: str,
@@ -76,63 +146,102 @@ class GrvtRest:
         size: Decimal,
         client_order_id: Optional[str] = None,
     ) -> OrderData:
-        """创建限价单（内存模拟）。"""
-
-        async with self._lock:
-            order_id = client_order_id or f"grvt_{int(time.time() * 1000)}"
-            timestamp = datetime.utcnow()
-            self._orders[order_id] = {
-                "id": order_id,
-                "client_id": client_order_id,
-                "symbol": symbol,
-                "side": side,
-                "type": OrderType.LIMIT,
-                "price": Decimal(str(price)),
-                "amount": Decimal(str(size)),
-                "filled": Decimal("0"),
-                "status": OrderStatus.OPEN,
-                "timestamp": timestamp,
-                "updated": timestamp,
-            }
-
-            if self.logger:
-                self.logger.info(
-                    f"GRVT 创建限价单: {order_id} {side.value} {size}@{price} ({symbol})"
-                )
-
-            return self._to_order_data(self._orders[order_id])
+        """创建限价单（内存模拟）。
+
+        price/size 需由调用方传入 Decimal（适配器层已完成转换），此处不再重复解析。
+        """
+
+        order_id = client_order_id or self.new_order_id()
+        timestamp = datetime.utcnow()
+        previous = self._orders.get(order_id)
+        if previous is None:
+            self._orders_by_symbol.setdefault(symbol, []).append(order_id)
+        elif previous.symbol != symbol:
+            # 复用 client_order_id 且交易对变化时，迁移索引
+            self._orders_by_symbol[previous.symbol].remove(order_id)
+            self._open_by_symbol.get(previous.symbol, {}).pop(order_id, None)
+            self._orders_by_symbol.setdefault(symbol, []).append(order_id)
+        self._open_by_symbol.setdefault(symbol, {})[order_id] = None
+        self._open_ids[order_id] = None
+        order = _OrderRec(
+            id=order_id,
+            client_id=client_order_id,
+            symbol=symbol,
+            side=side,
+            type=OrderType.LIMIT,
+            price=price,
+            amount=size,
+            filled=Decimal("0"),
+            status=OrderStatus.OPEN,
+            timestamp=timestamp,
+            updated=timestamp,
+        )
+        self._orders[order_id] = order
+        order_data = self._refresh_order_view(order)
+
+        if self.logger:
+            self.logger.info("GRVT 创建限价单: %s %s %s@%s (%s)", order_id, side.value, size, price, symbol)
+
+        return order_data
 
     async def cancel_order(
         self, symbol: str, order_id: Optional[str] = None, client_order_id: Optional[str] = None
     ) -> Optional[OrderData]:
         """撤销指定订单。"""
 
-        async with self._lock:
-            target_id = order_id or client_order_id
-            if not target_id:
-                return None
+        target_id = order_id or client_order_id
+        if not target_id:
+            return None
+
+        order = self._orders.get(target_id)
+        if not order:
+            return None
+
+        order_data = self._mark_canceled(target_id, order, datetime.utcnow())
+
+        if self.logger:
+            self.logger.info("GRVT 撤单: %s (%s)", target_id, symbol)
+
+        return order_data
+
+    async def cancel_orders_batch(self, symbol: Optional[str], ids: List[str]) -> List[OrderData]:
+        """批量撤单，返回成功撤销的订单（忽略未知 ID）。"""
 
-            order = self._orders.get(target_id)
-            if not order:
-                return None
+        now = datetime.utcnow()
+        cancelled: List[OrderData] = []
+        for order_id in ids:
+            order = self._orders.get(order_id)
+            if order:
+                cancelled.append(self._mark_canceled(order_id, order, now))
 
-            order["status"] = OrderStatus.CANCELED
-            order["updated"] = datetime.utcnow()
+        if self.logger and cancelled:
+            self.logger.info("GRVT 批量撤单: %s 笔 (%s)", len(cancelled), symbol or "ALL")
 
-            if self.logger:
-                self.logger.info(f"GRVT 撤单: {target_id} ({symbol})")
+        return cancelled
 
-            return self._to_order_data(order)
+    async def cancel_open_orders(self, symbol: Optional[str] = None) -> List[OrderData]:
+        """撤销全部未完成订单（可按交易对过滤）。"""
+
+        # 撤单会修改索引，先复制出 ID 列表
+        open_ids = list(self._open_by_symbol.get(symbol, ()) if symbol else self._open_ids)
+        if not open_ids:
+            return []
+        return await self.cancel_orders_batch(symbol, open_ids)
 
     async def get_open_orders(self, symbol: Optional[str] = None) -> List[OrderData]:
         """返回当前未完成订单。"""
 
-        async with self._lock:
-            orders: List[OrderData] = []
-            for order in self._orders.values():
-                if order["status"] == OrderStatus.OPEN and (not symbol or order["symbol"] == symbol):
-                    orders.append(self._to_order_data(order))
-            return orders
+        orders = self._orders
+        to_order_data = self._to_order_data
+        open_ids = self._open_by_symbol.get(symbol, ()) if symbol else self._open_ids
+        return [to_order_data(orders[i]) for i in open_ids]
+
+    async def get_orders(self, symbol: Optional[str] = None) -> List[OrderData]:
+        """返回已知订单（含已撤销），按创建顺序排列。"""
+
+        if symbol:
+            return [self._to_order_data(self._orders[i]) for i in self._orders_by_symbol.get(symbol, ())]
+        return [self._to_order_data(order) for order in self._orders.values()]
 
     async def get_position(self, symbol: str) -> PositionData:
         """返回符号对应的持仓（模拟）。"""
@@ -171,26 +280,52 @@ class GrvtRest:
             raw_data={"simulated": True},
         )
 
-    def _to_order_data(self, order: Dict[str, Any]) -> OrderData:
-        """内部工具：将缓存字典转换为 OrderData。"""
-
-        return OrderData(
-            id=str(order["id"]),
-            client_id=order.get("client_id"),
-            symbol=order["symbol"],
-            side=order["side"],
-            type=order.get("type", OrderType.LIMIT),
-            amount=order["amount"],
-            price=order.get("price"),
-            filled=order.get("filled", Decimal("0")),
-            remaining=order["amount"] - order.get("filled", Decimal("0")),
-            cost=(order.get("price") or Decimal("0")) * order["amount"],
-            average=order.get("price"),
-            status=order.get("status", OrderStatus.OPEN),
-            timestamp=order.get("timestamp", datetime.utcnow()),
-            updated=order.get("updated"),
+    def _mark_canceled(self, order_id: str, order: _OrderRec, now: datetime) -> OrderData:
+        """内部工具：将订单标记为已撤销并同步索引。"""
+
+        order.status = OrderStatus.CANCELED
+        order.updated = now
+        self._open_by_symbol.get(order.symbol, {}).pop(order_id, None)
+        self._open_ids.pop(order_id, None)
+        return self._refresh_order_view(order)
+
+    def _to_order_data(self, order: _OrderRec) -> OrderData:
+        """内部工具：由缓存字段快照生成 OrderData。
+
+        字段在订单变更时预先计算；这里直接填充实例字典并新建可变容器，
+        跳过 __post_init__，调用方修改返回值也不会污染缓存。
+        """
+
+        view = OrderData.__new__(OrderData)
+        view.__dict__.update(order.cached_fields)
+        view.trades = []
+        view.params = {"simulated": True}
+        view.raw_data = {"simulated": True}
+        return view
+
+    def _refresh_order_view(self, order: _OrderRec) -> OrderData:
+        """内部工具：订单变更后构建 OrderData 并缓存其字段快照。"""
+
+        order_data = OrderData(
+            id=str(order.id),
+            client_id=order.client_id,
+            symbol=order.symbol,
+            side=order.side,
+            type=order.type,
+            amount=order.amount,
+            price=order.price,
+            filled=order.filled,
+            remaining=order.amount - order.filled,
+            cost=(order.price or Decimal("0")) * order.amount,
+            average=order.price,
+            status=order.status,
+            timestamp=order.timestamp,
+            updated=order.updated,
             fee=None,
             trades=[],
             params={"simulated": True},
             raw_data={"simulated": True},
         )
+        # 快照中的容器字段不会对外暴露，_to_order_data 每次都会替换
+        order.cached_fields = order_data.__dict__.copy()
+        return order_data
@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Callable, Coroutine, List, Optional
+from typing import Any, Callable, Collection, Coroutine, Dict, List, Optional
 
 
 class GrvtWebSocket:
@@ -16,11 +16,21 @@ class GrvtWebSocket:
     def __init__(self, config=None, logger=None):
         self.logger = logger
         self.config = config
-        self._callbacks: List[Callable[[Any], Any]] = []
+        # 订阅时一次性区分同步/异步回调，避免每个事件重复判断
+        self._sync_callbacks: List[Callable[[Any], Any]] = []
+        self._async_callbacks: List[Callable[[Any], Coroutine[Any, Any, Any]]] = []
         self._connected = False
-        self._queue: asyncio.Queue = asyncio.Queue()
+        # 待分发事件按订单 id 合并：回调积压时每个订单只保留最新状态
+        self._pending: Dict[Any, Any] = {}
+        self._wake = asyncio.Event()
         self._consumer_task: Optional[asyncio.Task] = None
 
+    @property
+    def has_listeners(self) -> bool:
+        """是否存在需要接收用户事件的订阅回调。"""
+
+        return bool(self._sync_callbacks or self._async_callbacks)
+
     async def connect(self) -> bool:
         """建立（模拟）WebSocket 连接。"""
 
@@ -50,35 +60,83 @@ class GrvtWebSocket:
     async def subscribe_user_stream(self, callback: Callable[[Any], Any]) -> None:
         """订阅用户数据流。"""
 
-        self._callbacks.append(callback)
+        if asyncio.iscoroutinefunction(callback):
+            self._async_callbacks.append(callback)
+        else:
+            self._sync_callbacks.append(callback)
         if self.logger:
             self.logger.info("GRVT 已订阅用户数据流回调")
 
+    async def unsubscribe_user_stream(self) -> None:
+        """取消全部用户数据流回调。"""
+
+        self._sync_callbacks = []
+        self._async_callbacks = []
+
     async def send_user_event(self, data: Any) -> None:
-        """将事件放入内部队列，交由消费协程分发。"""
+        """将事件放入待分发表（同一订单仅保留最新状态），交由消费协程分发。"""
+
+        await self.send_user_events((data,))
+
+    async def send_user_events(self, batch: Collection[Any]) -> None:
+        """批量放入事件，只唤醒一次消费协程。"""
+
+        # 无人订阅时直接丢弃，也不触发自动重连
+        if not self.has_listeners:
+            return
 
         if not self._connected:
             if self.logger:
                 self.logger.warning("GRVT WebSocket 未连接，自动尝试重连")
             await self.connect()
 
-        await self._queue.put(data)
+        pending = self._pending
+        for data in batch:
+            key = getattr(data, "id", None) or id(data)
+            # 先移除再写入，使合并后的事件按最近一次更新的顺序分发
+            pending.pop(key, None)
+            pending[key] = data
+        self._wake.set()
 
     async def _consume(self) -> None:
-        """事件消费协程：顺序将事件广播给订阅回调。"""
+        """事件消费协程：取出全部待分发事件，按顺序广播给订阅回调。"""
 
         try:
             while self._connected:
-                data = await self._queue.get()
-                for callback in list(self._callbacks):
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(data)
-                        else:
-                            callback(data)
-                    except Exception as e:
-                        if self.logger:
-                            self.logger.error(f"处理 GRVT WS 事件失败: {e}")
+                await self._wake.wait()
+                self._wake.clear()
+                # 直接交换缓冲区引用，取走整批事件而无需拷贝
+                batch, self._pending = self._pending, {}
+                await self._dispatch_batch(batch.values())
         except asyncio.CancelledError:
             pass
 
+    async def _dispatch_batch(self, batch: Collection[Any]) -> None:
+        """按批广播事件：同步回调逐个处理整批，异步回调之间并发执行。"""
+
+        # 退订通过替换列表实现，迭代中的旧列表不受影响，无需逐事件拷贝
+        for callback in self._sync_callbacks:
+            for data in batch:
+                try:
+                    callback(data)
+                except Exception as e:
+                    if self.logger:
+                        self.logger.error("处理 GRVT WS 事件失败: %s", e)
+
+        if self._async_callbacks:
+            await asyncio.gather(
+                *(self._run_async_callback(callback, batch) for callback in self._async_callbacks)
+            )
+
+    async def _run_async_callback(
+        self, callback: Callable[[Any], Coroutine[Any, Any, Any]], batch: Collection[Any]
+    ) -> None:
+        """对单个异步回调按顺序投递整批事件，保证同一回调内事件有序。"""
+
+        for data in batch:
+            try:
+                await callback(data)
+            except Exception as e:
+                if self.logger:
+                    self.logger.error("处理 GRVT WS 事件失败: %s", e)
+